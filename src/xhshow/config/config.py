@@ -1,12 +1,53 @@
 from dataclasses import dataclass, field, replace
-from typing import Any
+from types import MappingProxyType
+from typing import Any, ClassVar
 
 __all__ = ["CryptoConfig"]
 
-
-@dataclass(frozen=True)
+# Template defaults live at module level as read-only mappings; each
+# CryptoConfig() takes a flat .copy instead of rebuilding the dict
+# literal inside a default_factory lambda
+_SIGNATURE_DATA_TEMPLATE = MappingProxyType(
+    {
+        "x0": "4.2.6",
+        "x1": "xhs-pc-web",
+        "x2": "Windows",
+        "x3": "",
+        "x4": "",
+    }
+)
+
+_SIGNATURE_XSCOMMON_TEMPLATE = MappingProxyType(
+    {
+        "s0": 5,
+        "s1": "",
+        "x0": "1",
+        "x1": "4.2.6",
+        "x2": "Windows",
+        "x3": "xhs-pc-web",
+        "x4": "4.86.0",
+        "x5": "",
+        "x6": "",
+        "x7": "",
+        "x8": "",
+        "x9": -596800761,
+        "x10": 0,
+        "x11": "normal",
+    }
+)
+
+
+@dataclass(frozen=True, slots=True)
 class CryptoConfig:
-    """Configuration constants for cryptographic operations"""
+    """Configuration constants for cryptographic operations
+
+    Protocol constants (alphabets, keys, byte tables, lengths) are
+    ClassVars: they are shared per-class, cost no per-instance storage
+    and are never overridable. The customization points — random value
+    ranges, session init/step ranges, signature templates and the
+    X3/XYS prefixes — remain dataclass fields and can be changed via
+    with_overrides().
+    """
 
     # Gid encrypt parameters
     DES_KEY = "zbp30y86"
@@ -17,31 +58,33 @@ class CryptoConfig:
     DATA_webBuild = "5.0.3"
 
     # Bitwise operation constants
-    MAX_32BIT: int = 0xFFFFFFFF
-    MAX_SIGNED_32BIT: int = 0x7FFFFFFF
-    MAX_BYTE: int = 255
+    MAX_32BIT: ClassVar[int] = 0xFFFFFFFF
+    MAX_SIGNED_32BIT: ClassVar[int] = 0x7FFFFFFF
+    MAX_BYTE: ClassVar[int] = 255
 
     # Base64 encoding constants
-    STANDARD_BASE64_ALPHABET: str = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
-    CUSTOM_BASE64_ALPHABET: str = "ZmserbBoHQtNP+wOcza/LpngG8yJq42KWYj0DSfdikx3VT16IlUAFM97hECvuRX5"
-    X3_BASE64_ALPHABET: str = "MfgqrsbcyzPQRStuvC7mn501HIJBo2DEFTKdeNOwxWXYZap89+/A4UVLhijkl63G"
+    STANDARD_BASE64_ALPHABET: ClassVar[str] = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+    CUSTOM_BASE64_ALPHABET: ClassVar[str] = "ZmserbBoHQtNP+wOcza/LpngG8yJq42KWYj0DSfdikx3VT16IlUAFM97hECvuRX5"
+    X3_BASE64_ALPHABET: ClassVar[str] = "MfgqrsbcyzPQRStuvC7mn501HIJBo2DEFTKdeNOwxWXYZap89+/A4UVLhijkl63G"
 
     # XOR key for payload transformation (144 bytes)
-    HEX_KEY: str = "71a302257793271ddd273bcee3e4b98d9d7935e1da33f5765e2ea8afb6dc77a51a499d23b67c20660025860cbf13d4540d92497f58686c574e508f46e1956344f39139bf4faf22a3eef120b79258145b2feb5193b6478669961298e79bedca646e1a693a926154a5a7a1bd1cf0dedb742f917a747a1e388b234f2277516db7116035439730fa61e9822a0eca7bff72d8"  # noqa: E501
+    HEX_KEY: ClassVar[str] = (
+        "71a302257793271ddd273bcee3e4b98d9d7935e1da33f5765e2ea8afb6dc77a51a499d23b67c20660025860cbf13d4540d92497f58686c574e508f46e1956344f39139bf4faf22a3eef120b79258145b2feb5193b6478669961298e79bedca646e1a693a926154a5a7a1bd1cf0dedb742f917a747a1e388b234f2277516db7116035439730fa61e9822a0eca7bff72d8"  # noqa: E501
+    )
 
     # Hexadecimal processing constants
-    EXPECTED_HEX_LENGTH: int = 32
-    OUTPUT_BYTE_COUNT: int = 8
-    HEX_CHUNK_SIZE: int = 2
+    EXPECTED_HEX_LENGTH: ClassVar[int] = 32
+    OUTPUT_BYTE_COUNT: ClassVar[int] = 8
+    HEX_CHUNK_SIZE: ClassVar[int] = 2
 
     # Payload construction constants
-    VERSION_BYTES: list[int] = field(default_factory=lambda: [121, 104, 96, 41])
-    PAYLOAD_LENGTH: int = 144
-    A1_LENGTH: int = 52
-    APP_ID_LENGTH: int = 10
-    MD5_XOR_LENGTH: int = 8
-    A3_PREFIX: list[int] = field(default_factory=lambda: [2, 97, 51, 16])
-    TIMESTAMP_LE_LENGTH: int = 8
+    VERSION_BYTES: ClassVar[bytes] = bytes([121, 104, 96, 41])
+    PAYLOAD_LENGTH: ClassVar[int] = 144
+    A1_LENGTH: ClassVar[int] = 52
+    APP_ID_LENGTH: ClassVar[int] = 10
+    MD5_XOR_LENGTH: ClassVar[int] = 8
+    A3_PREFIX: ClassVar[bytes] = bytes([2, 97, 51, 16])
+    TIMESTAMP_LE_LENGTH: ClassVar[int] = 8
 
     # Random value ranges
     SEQUENCE_VALUE_MIN: int = 15
@@ -60,74 +103,45 @@ class CryptoConfig:
     SESSION_WINDOW_PROPS_STEP_MAX: int = 10
 
     # Checksum constants (16 bytes total)
-    CHECKSUM_VERSION: int = 1
-    CHECKSUM_XOR_KEY: int = 115
-    CHECKSUM_FIXED_TAIL: list[int] = field(
-        default_factory=lambda: [249, 65, 103, 103, 201, 181, 131, 99, 94, 7, 68, 250, 132, 21]
-    )
+    CHECKSUM_VERSION: ClassVar[int] = 1
+    CHECKSUM_XOR_KEY: ClassVar[int] = 115
+    CHECKSUM_FIXED_TAIL: ClassVar[bytes] = bytes([249, 65, 103, 103, 201, 181, 131, 99, 94, 7, 68, 250, 132, 21])
 
     # Environment detection constants (15 values for part11 XOR)
-    ENV_TABLE: list[int] = field(
-        default_factory=lambda: [115, 248, 83, 102, 103, 201, 181, 131, 99, 94, 4, 68, 250, 132, 21]
-    )
+    ENV_TABLE: ClassVar[bytes] = bytes([115, 248, 83, 102, 103, 201, 181, 131, 99, 94, 4, 68, 250, 132, 21])
 
     # Default environment check values (normal browser)
-    ENV_CHECKS_DEFAULT: list[int] = field(default_factory=lambda: [0, 1, 18, 1, 0, 0, 0, 0, 0, 0, 3, 0, 0, 0, 0])
+    ENV_CHECKS_DEFAULT: ClassVar[bytes] = bytes([0, 1, 18, 1, 0, 0, 0, 0, 0, 0, 3, 0, 0, 0, 0])
 
     # custom_hash_v2 initial vector
-    HASH_IV: tuple[int, int, int, int] = (1831565813, 461845907, 2246822507, 3266489909)
+    HASH_IV: ClassVar[tuple[int, int, int, int]] = (1831565813, 461845907, 2246822507, 3266489909)
 
     # Environment fingerprint generation parameters
-    ENV_FINGERPRINT_XOR_KEY: int = 41
+    ENV_FINGERPRINT_XOR_KEY: ClassVar[int] = 41
     ENV_FINGERPRINT_TIME_OFFSET_MIN: int = 10
     ENV_FINGERPRINT_TIME_OFFSET_MAX: int = 50
 
     # Signature data template
-    SIGNATURE_DATA_TEMPLATE: dict[str, str] = field(
-        default_factory=lambda: {
-            "x0": "4.2.6",
-            "x1": "xhs-pc-web",
-            "x2": "Windows",
-            "x3": "",
-            "x4": "",
-        }
-    )
+    SIGNATURE_DATA_TEMPLATE: dict[str, str] = field(default_factory=_SIGNATURE_DATA_TEMPLATE.copy)
 
     # Prefix constants
     X3_PREFIX: str = "mns0301_"
     XYS_PREFIX: str = "XYS_"
 
     # Trace ID generation constants
-    HEX_CHARS: str = "abcdef0123456789"
-    XRAY_TRACE_ID_SEQ_MAX: int = 8388607  # 2^23-1
-    XRAY_TRACE_ID_TIMESTAMP_SHIFT: int = 23
-    XRAY_TRACE_ID_PART1_LENGTH: int = 16
-    XRAY_TRACE_ID_PART2_LENGTH: int = 16
-    B3_TRACE_ID_LENGTH: int = 16
+    HEX_CHARS: ClassVar[str] = "abcdef0123456789"
+    XRAY_TRACE_ID_SEQ_MAX: ClassVar[int] = 8388607  # 2^23-1
+    XRAY_TRACE_ID_TIMESTAMP_SHIFT: ClassVar[int] = 23
+    XRAY_TRACE_ID_PART1_LENGTH: ClassVar[int] = 16
+    XRAY_TRACE_ID_PART2_LENGTH: ClassVar[int] = 16
+    B3_TRACE_ID_LENGTH: ClassVar[int] = 16
 
     # b1 secret key
-    B1_SECRET_KEY: str = "xhswebmplfbt"
-
-    SIGNATURE_XSCOMMON_TEMPLATE: dict[str, Any] = field(
-        default_factory=lambda: {
-            "s0": 5,
-            "s1": "",
-            "x0": "1",
-            "x1": "4.2.6",
-            "x2": "Windows",
-            "x3": "xhs-pc-web",
-            "x4": "4.86.0",
-            "x5": "",
-            "x6": "",
-            "x7": "",
-            "x8": "",
-            "x9": -596800761,
-            "x10": 0,
-            "x11": "normal",
-        }
-    )
+    B1_SECRET_KEY: ClassVar[str] = "xhswebmplfbt"
 
-    PUBLIC_USERAGENT: str = (
+    SIGNATURE_XSCOMMON_TEMPLATE: dict[str, Any] = field(default_factory=_SIGNATURE_XSCOMMON_TEMPLATE.copy)
+
+    PUBLIC_USERAGENT: ClassVar[str] = (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/142.0.0.0 Safari/537.36 Edg/142.0.0.0"
     )
@@ -136,6 +150,10 @@ class CryptoConfig:
         """
         Create a new config instance with overridden values
 
+        Only the customization fields (random value ranges, session
+        init/step ranges, signature templates, X3_PREFIX, XYS_PREFIX)
+        can be overridden; the protocol ClassVar constants cannot.
+
         Args:
             **kwargs: Field names and their new values
 
@@ -1,9 +1,16 @@
+import functools
 import hashlib
 import struct
 import time
 from typing import TYPE_CHECKING
 
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
 from ..config import CryptoConfig
+from ..utils._hash_numba import custom_hash_v2_nb
 from ..utils.bit_ops import BitOperations
 from ..utils.encoder import Base64Encoder
 from ..utils.hex_utils import HexProcessor
@@ -16,6 +23,14 @@ if TYPE_CHECKING:
 
 __all__ = ["CryptoProcessor"]
 
+_MASK32 = 0xFFFFFFFF
+
+
+@functools.lru_cache(maxsize=256)
+def _md5_api_path(api_path: str) -> bytes:
+    """MD5 digest of an API path; cached since hot endpoints repeat"""
+    return hashlib.md5(api_path.encode("utf-8")).digest()
+
 
 class CryptoProcessor:
     def __init__(self, config: CryptoConfig | None = None):
@@ -25,24 +40,22 @@ class CryptoProcessor:
         self.hex_processor = HexProcessor(self.config)
         self.random_gen = RandomGenerator()
 
-    def _int_to_le_bytes(self, val: int, length: int = 4) -> list[int]:
-        """Convert integer to little-endian byte array"""
-        arr = []
-        for _ in range(length):
-            arr.append(val & 0xFF)
-            val >>= 8
-        return arr
-
-    def _rotate_left(self, val: int, n: int) -> int:
-        """32-bit left rotation"""
-        return ((val << n) | (val >> (32 - n))) & self.config.MAX_32BIT
+        # part11 only varies in its second byte (seed ^ ENV_TABLE[0]);
+        # the 14-byte tail is a pure function of frozen config constants
+        self._env0 = self.config.ENV_TABLE[0]
+        self._part11_tail = bytes(
+            a ^ b for a, b in zip(self.config.ENV_TABLE[1:], self.config.ENV_CHECKS_DEFAULT[1:], strict=True)
+        )
 
-    def _custom_hash_v2(self, input_bytes: list[int]) -> list[int]:
+    def _custom_hash_v2(self, input_bytes: bytes) -> bytes:
         """
         Custom hash function for a3 field generation
-        Input: byte list (must be multiple of 8)
-        Output: 16-byte list
+        Input: bytes (length must be multiple of 8)
+        Output: 16-byte hash
         """
+        if custom_hash_v2_nb is not None:
+            return custom_hash_v2_nb(input_bytes, self.config.HASH_IV)
+
         s0, s1, s2, s3 = self.config.HASH_IV
         length = len(input_bytes)
 
@@ -51,33 +64,41 @@ class CryptoProcessor:
         s2 ^= length << 16
         s3 ^= length << 24
 
-        for i in range(length // 8):
-            v0, v1 = struct.unpack("<II", bytes(input_bytes[i * 8 : (i + 1) * 8]))
-
-            s0 = self._rotate_left(((s0 + v0) & self.config.MAX_32BIT) ^ s2, 7)
-            s1 = self._rotate_left(((v0 ^ s1) + s3) & self.config.MAX_32BIT, 11)
-            s2 = self._rotate_left(((s2 + v1) & self.config.MAX_32BIT) ^ s0, 13)
-            s3 = self._rotate_left(((s3 ^ v1) + s1) & self.config.MAX_32BIT, 17)
+        # Unpack every (v0, v1) pair in one shot instead of slicing and
+        # struct.unpack-ing 8 bytes per iteration
+        if _np is not None:
+            word_pairs = _np.frombuffer(input_bytes, dtype="<u4").reshape(-1, 2).tolist()
+        else:
+            word_pairs = struct.iter_unpack("<II", input_bytes)
+
+        # Rotates are inlined as (x << n) | (x >> (32 - n)) against the
+        # module-level mask to avoid method dispatch per iteration
+        for v0, v1 in word_pairs:
+            s0 = ((s0 + v0) & _MASK32) ^ s2
+            s0 = ((s0 << 7) | (s0 >> 25)) & _MASK32
+            s1 = ((v0 ^ s1) + s3) & _MASK32
+            s1 = ((s1 << 11) | (s1 >> 21)) & _MASK32
+            s2 = ((s2 + v1) & _MASK32) ^ s0
+            s2 = ((s2 << 13) | (s2 >> 19)) & _MASK32
+            s3 = ((s3 ^ v1) + s1) & _MASK32
+            s3 = ((s3 << 17) | (s3 >> 15)) & _MASK32
 
         t0 = s0 ^ length
         t1 = s1 ^ t0
-        t2 = (s2 + t1) & self.config.MAX_32BIT
+        t2 = (s2 + t1) & _MASK32
         t3 = s3 ^ t2
 
-        rot_t0 = self._rotate_left(t0, 9)
-        rot_t1 = self._rotate_left(t1, 13)
-        rot_t2 = self._rotate_left(t2, 17)
-        rot_t3 = self._rotate_left(t3, 19)
+        rot_t0 = ((t0 << 9) | (t0 >> 23)) & _MASK32
+        rot_t1 = ((t1 << 13) | (t1 >> 19)) & _MASK32
+        rot_t2 = ((t2 << 17) | (t2 >> 15)) & _MASK32
+        rot_t3 = ((t3 << 19) | (t3 >> 13)) & _MASK32
 
-        s0 = (rot_t0 + rot_t2) & self.config.MAX_32BIT
+        s0 = (rot_t0 + rot_t2) & _MASK32
         s1 = rot_t1 ^ rot_t3
-        s2 = (rot_t2 + s0) & self.config.MAX_32BIT
+        s2 = (rot_t2 + s0) & _MASK32
         s3 = rot_t3 ^ s1
 
-        result = []
-        for s in [s0, s1, s2, s3]:
-            result.extend(self._int_to_le_bytes(s, 4))
-        return result
+        return struct.pack("<IIII", s0, s1, s2, s3)
 
     def build_payload_array(
         self,
@@ -87,7 +108,7 @@ class CryptoProcessor:
         string_param: str = "",
         timestamp: float | None = None,
         sign_state: "SignState | None" = None,
-    ) -> list[int]:
+    ) -> bytes:
         """
         Build 144-byte payload array (mns0301 version)
 
@@ -100,66 +121,101 @@ class CryptoProcessor:
             sign_state (SignState | None): Optional state for realistic signature generation.
 
         Returns:
-            list[int]: Complete payload byte array (144 bytes)
+            bytes: Complete payload byte array (144 bytes)
         """
-        timestamp = time.time() if timestamp is None else timestamp
+        # Single integer-millisecond read; time_ns avoids the float
+        # multiply and its rounding near timestamp boundaries
+        ts_ms = time.time_ns() // 1_000_000 if timestamp is None else int(timestamp * 1000)
+        cfg = self.config
         seed = self.random_gen.generate_random_int()
         seed_byte = seed & 0xFF
 
-        payload = list(self.config.VERSION_BYTES)
-        payload.extend(self._int_to_le_bytes(seed, 4))
+        ts_len = cfg.TIMESTAMP_LE_LENGTH
 
-        ts_bytes = self._int_to_le_bytes(int(timestamp * 1000), self.config.TIMESTAMP_LE_LENGTH)
-        payload.extend(ts_bytes)
+        # Every field has a fixed length, so the payload is written into a
+        # preallocated buffer at known offsets instead of growing a list
+        buf = bytearray(cfg.PAYLOAD_LENGTH)
+        buf[0:4] = cfg.VERSION_BYTES
+        buf[4:8] = seed.to_bytes(4, "little")
+
+        ts_bytes = ts_ms.to_bytes(ts_len, "little")
+        pos = 8
+        buf[pos : pos + ts_len] = ts_bytes
+        pos += ts_len
 
         if sign_state:
-            payload.extend(self._int_to_le_bytes(sign_state.page_load_timestamp, self.config.TIMESTAMP_LE_LENGTH))
-            payload.extend(self._int_to_le_bytes(sign_state.sequence_value, 4))
-            payload.extend(self._int_to_le_bytes(sign_state.window_props_length, 4))
-            payload.extend(self._int_to_le_bytes(sign_state.uri_length, 4))
+            buf[pos : pos + ts_len] = sign_state.page_load_timestamp.to_bytes(ts_len, "little")
+            pos += ts_len
+            buf[pos : pos + 4] = sign_state.sequence_value.to_bytes(4, "little")
+            buf[pos + 4 : pos + 8] = sign_state.window_props_length.to_bytes(4, "little")
+            buf[pos + 8 : pos + 12] = sign_state.uri_length.to_bytes(4, "little")
+            pos += 12
         else:
-            time_offset = self.random_gen.generate_random_byte_in_range(
-                self.config.ENV_FINGERPRINT_TIME_OFFSET_MIN,
-                self.config.ENV_FINGERPRINT_TIME_OFFSET_MAX,
+            # One 64-bit entropy draw feeds all three fingerprint values
+            # through 16-bit lanes; the slight modulo bias is fine for
+            # these simulated client counters
+            bits = self.random_gen.generate_random_bits(64)
+            time_offset = cfg.ENV_FINGERPRINT_TIME_OFFSET_MIN + (bits & 0xFFFF) % (
+                cfg.ENV_FINGERPRINT_TIME_OFFSET_MAX - cfg.ENV_FINGERPRINT_TIME_OFFSET_MIN + 1
             )
-            effective_ts_ms = int((timestamp - time_offset) * 1000)
-            payload.extend(self._int_to_le_bytes(effective_ts_ms, self.config.TIMESTAMP_LE_LENGTH))
+            effective_ts_ms = ts_ms - time_offset * 1000
+            buf[pos : pos + ts_len] = effective_ts_ms.to_bytes(ts_len, "little")
+            pos += ts_len
 
-            sequence_value = self.random_gen.generate_random_byte_in_range(
-                self.config.SEQUENCE_VALUE_MIN, self.config.SEQUENCE_VALUE_MAX
+            sequence_value = cfg.SEQUENCE_VALUE_MIN + ((bits >> 16) & 0xFFFF) % (
+                cfg.SEQUENCE_VALUE_MAX - cfg.SEQUENCE_VALUE_MIN + 1
             )
-            payload.extend(self._int_to_le_bytes(sequence_value, 4))
+            buf[pos : pos + 4] = sequence_value.to_bytes(4, "little")
 
-            window_props_length = self.random_gen.generate_random_byte_in_range(
-                self.config.WINDOW_PROPS_LENGTH_MIN, self.config.WINDOW_PROPS_LENGTH_MAX
+            window_props_length = cfg.WINDOW_PROPS_LENGTH_MIN + ((bits >> 32) & 0xFFFF) % (
+                cfg.WINDOW_PROPS_LENGTH_MAX - cfg.WINDOW_PROPS_LENGTH_MIN + 1
             )
-            payload.extend(self._int_to_le_bytes(window_props_length, 4))
+            buf[pos + 4 : pos + 8] = window_props_length.to_bytes(4, "little")
 
-            uri_length = len(string_param.encode("utf-8"))
-            payload.extend(self._int_to_le_bytes(uri_length, 4))
+            # ASCII strings (the overwhelming common case) have one byte
+            # per character, so skip the encode-just-for-length copy
+            if string_param.isascii():
+                uri_length = len(string_param)
+            else:
+                uri_length = len(string_param.encode("utf-8"))
+            buf[pos + 8 : pos + 12] = uri_length.to_bytes(4, "little")
+            pos += 12
 
         md5_bytes = bytes.fromhex(hex_parameter)
-        payload.extend([md5_bytes[i] ^ seed_byte for i in range(self.config.MD5_XOR_LENGTH)])
-
-        a1_bytes = a1_value.encode("utf-8")[: self.config.A1_LENGTH].ljust(self.config.A1_LENGTH, b"\x00")
-        payload.append(len(a1_bytes))
-        payload.extend(a1_bytes)
-
-        app_bytes = app_identifier.encode("utf-8")[: self.config.APP_ID_LENGTH].ljust(
-            self.config.APP_ID_LENGTH, b"\x00"
-        )
-        payload.append(len(app_bytes))
-        payload.extend(app_bytes)
-
-        part11 = [1, seed_byte ^ self.config.ENV_TABLE[0]]
-        part11 += [self.config.ENV_TABLE[i] ^ self.config.ENV_CHECKS_DEFAULT[i] for i in range(1, 15)]
-        payload.extend(part11)
-
-        api_path = extract_api_path(string_param)
-        api_path_bytes = api_path.encode("utf-8")
-        hex_md5 = hashlib.md5(api_path_bytes).hexdigest()
-        md5_path_bytes = [int(hex_md5[i : i + 2], 16) for i in range(0, 32, 2)]
-
-        payload.extend(self.config.A3_PREFIX + [b ^ seed_byte for b in self._custom_hash_v2(ts_bytes + md5_path_bytes)])
-
-        return payload
+        md5_len = cfg.MD5_XOR_LENGTH
+        # XOR the whole chunk against the broadcast seed byte in one
+        # wide integer operation instead of per-byte Python XORs
+        seed_mask = int.from_bytes(bytes([seed_byte]) * md5_len, "little")
+        xored_md5 = int.from_bytes(md5_bytes[:md5_len], "little") ^ seed_mask
+        buf[pos : pos + md5_len] = xored_md5.to_bytes(md5_len, "little")
+        pos += md5_len
+
+        # The buffer is pre-zeroed, so truncated fields need no .ljust
+        # padding; the length byte stays the fixed field width
+        a1_len = cfg.A1_LENGTH
+        a1_bytes = a1_value.encode("utf-8")[:a1_len]
+        buf[pos] = a1_len
+        buf[pos + 1 : pos + 1 + len(a1_bytes)] = a1_bytes
+        pos += 1 + a1_len
+
+        app_len = cfg.APP_ID_LENGTH
+        app_bytes = app_identifier.encode("utf-8")[:app_len]
+        buf[pos] = app_len
+        buf[pos + 1 : pos + 1 + len(app_bytes)] = app_bytes
+        pos += 1 + app_len
+
+        buf[pos] = 1
+        buf[pos + 1] = seed_byte ^ self._env0
+        buf[pos + 2 : pos + 16] = self._part11_tail
+        pos += 16
+
+        md5_path_bytes = _md5_api_path(extract_api_path(string_param))
+
+        buf[pos : pos + 4] = cfg.A3_PREFIX
+        pos += 4
+        hash_bytes = self._custom_hash_v2(ts_bytes + md5_path_bytes)
+        hash_mask = int.from_bytes(bytes([seed_byte]) * 16, "little")
+        xored_hash = int.from_bytes(hash_bytes, "little") ^ hash_mask
+        buf[pos : pos + 16] = xored_hash.to_bytes(16, "little")
+
+        return bytes(buf)
@@ -24,30 +24,41 @@ class SessionManager:
 
     def __init__(self, config: CryptoConfig | None = None):
         self._config = config or CryptoConfig()
+        # Dedicated generator: avoids the lock and global lookups of the
+        # shared module-level Mersenne Twister on the signing hot path
+        self._rand = random.Random()
         self.page_load_timestamp: int = int(time.time() * 1000)
-        self.sequence_value: int = random.randint(
+        self.sequence_value: int = self._rand.randint(
             self._config.SESSION_SEQUENCE_INIT_MIN,
             self._config.SESSION_SEQUENCE_INIT_MAX,
         )
-        self.window_props_length: int = random.randint(
+        self.window_props_length: int = self._rand.randint(
             self._config.SESSION_WINDOW_PROPS_INIT_MIN,
             self._config.SESSION_WINDOW_PROPS_INIT_MAX,
         )
 
+        # Precomputed step ranges so update_state can draw from
+        # getrandbits instead of the much heavier randint/randrange
+        self._seq_step_min = self._config.SESSION_SEQUENCE_STEP_MIN
+        self._seq_step_span = self._config.SESSION_SEQUENCE_STEP_MAX - self._seq_step_min + 1
+        self._seq_step_bits = max((self._seq_step_span - 1).bit_length(), 1)
+        self._win_step_min = self._config.SESSION_WINDOW_PROPS_STEP_MIN
+        self._win_step_span = self._config.SESSION_WINDOW_PROPS_STEP_MAX - self._win_step_min + 1
+        self._win_step_bits = max((self._win_step_span - 1).bit_length(), 1)
+
     def update_state(self):
         """
         Updates the session state to simulate user activity between requests.
 
         This method should be called before each signing operation.
+
+        The steps are drawn with getrandbits plus a modulo; the slight
+        modulo bias is intentional and fine here since these counters are
+        simulated client fingerprints, not secrets.
         """
-        self.sequence_value += random.randint(
-            self._config.SESSION_SEQUENCE_STEP_MIN,
-            self._config.SESSION_SEQUENCE_STEP_MAX,
-        )
-        self.window_props_length += random.randint(
-            self._config.SESSION_WINDOW_PROPS_STEP_MIN,
-            self._config.SESSION_WINDOW_PROPS_STEP_MAX,
-        )
+        rand = self._rand
+        self.sequence_value += self._seq_step_min + rand.getrandbits(self._seq_step_bits) % self._seq_step_span
+        self.window_props_length += self._win_step_min + rand.getrandbits(self._win_step_bits) % self._win_step_span
 
     def get_current_state(self, uri: str) -> SignState:
         """
@@ -0,0 +1,80 @@
+"""Optional Numba-accelerated kernel for the a3 custom hash
+
+The pure-Python loop in ``CryptoProcessor._custom_hash_v2`` is
+interpreter-bound; when numba/numpy are installed (``pip install
+xhshow[speedups]``) the same recurrence is compiled to native code.
+When they are missing ``custom_hash_v2_nb`` is ``None`` and callers
+fall back to the Python implementation.
+"""
+
+__all__ = ["custom_hash_v2_nb"]
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    custom_hash_v2_nb = None
+else:
+    _MASK32 = np.uint64(0xFFFFFFFF)
+
+    @njit(cache=True, boundscheck=False)
+    def _custom_hash_v2_kernel(words, length, iv0, iv1, iv2, iv3):  # pragma: no cover - compiled
+        # Numba widens uint32 scalar arithmetic to 64-bit, so wrap-around
+        # is enforced with explicit masks; LLVM still folds the
+        # (x << n) | (x >> (32 - n)) pattern to a single rotate.
+        s0 = (iv0 ^ length) & _MASK32
+        s1 = (iv1 ^ (length << np.uint64(8))) & _MASK32
+        s2 = (iv2 ^ (length << np.uint64(16))) & _MASK32
+        s3 = (iv3 ^ (length << np.uint64(24))) & _MASK32
+
+        for i in range(words.shape[0] // 2):
+            v0 = np.uint64(words[2 * i])
+            v1 = np.uint64(words[2 * i + 1])
+
+            s0 = (((s0 + v0) & _MASK32) ^ s2) & _MASK32
+            s0 = ((s0 << np.uint64(7)) | (s0 >> np.uint64(25))) & _MASK32
+            s1 = ((v0 ^ s1) + s3) & _MASK32
+            s1 = ((s1 << np.uint64(11)) | (s1 >> np.uint64(21))) & _MASK32
+            s2 = (((s2 + v1) & _MASK32) ^ s0) & _MASK32
+            s2 = ((s2 << np.uint64(13)) | (s2 >> np.uint64(19))) & _MASK32
+            s3 = ((s3 ^ v1) + s1) & _MASK32
+            s3 = ((s3 << np.uint64(17)) | (s3 >> np.uint64(15))) & _MASK32
+
+        t0 = (s0 ^ length) & _MASK32
+        t1 = s1 ^ t0
+        t2 = (s2 + t1) & _MASK32
+        t3 = s3 ^ t2
+
+        rot_t0 = ((t0 << np.uint64(9)) | (t0 >> np.uint64(23))) & _MASK32
+        rot_t1 = ((t1 << np.uint64(13)) | (t1 >> np.uint64(19))) & _MASK32
+        rot_t2 = ((t2 << np.uint64(17)) | (t2 >> np.uint64(15))) & _MASK32
+        rot_t3 = ((t3 << np.uint64(19)) | (t3 >> np.uint64(13))) & _MASK32
+
+        out = np.empty(4, dtype=np.uint32)
+        out[0] = (rot_t0 + rot_t2) & _MASK32
+        out[1] = rot_t1 ^ rot_t3
+        out[2] = (rot_t2 + out[0]) & _MASK32
+        out[3] = rot_t3 ^ out[1]
+        return out
+
+    def custom_hash_v2_nb(input_bytes: bytes, iv: tuple[int, int, int, int]) -> bytes:
+        """
+        Compiled equivalent of ``CryptoProcessor._custom_hash_v2``
+
+        Args:
+            input_bytes (bytes): Input buffer (length must be a multiple of 8)
+            iv (tuple[int, int, int, int]): Hash initial vector
+
+        Returns:
+            bytes: 16-byte hash result
+        """
+        words = np.frombuffer(input_bytes, dtype="<u4")
+        state = _custom_hash_v2_kernel(
+            words,
+            np.uint64(len(input_bytes)),
+            np.uint64(iv[0]),
+            np.uint64(iv[1]),
+            np.uint64(iv[2]),
+            np.uint64(iv[3]),
+        )
+        return state.astype("<u4").tobytes()
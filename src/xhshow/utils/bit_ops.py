@@ -59,12 +59,12 @@ class BitOperations:
 
         return self.to_signed_32bit(shifted_result)
 
-    def xor_transform_array(self, source_integers: list[int]) -> bytearray:
+    def xor_transform_array(self, source_integers: list[int] | bytes | bytearray) -> bytearray:
         """
         Perform XOR transformation on integer array
 
         Args:
-            source_integers (list[int]): Source integer array
+            source_integers (list[int] | bytes | bytearray): Source integer array
 
         Returns:
             bytearray: Transformed byte array
@@ -37,6 +37,18 @@ class RandomGenerator:
         """
         return random.randint(min_val, max_val)
 
+    def generate_random_bits(self, bit_count: int) -> int:
+        """
+        Generate random integer with the given number of bits
+
+        Args:
+            bit_count (int): Number of random bits
+
+        Returns:
+            int: Random integer in [0, 2**bit_count)
+        """
+        return random.getrandbits(bit_count)
+
     def generate_random_int(self) -> int:
         """
         Generate 32-bit random integer
@@ -1,7 +1,12 @@
+import re
 from urllib.parse import urlparse
 
 __all__ = ["extract_uri", "build_url", "extract_api_path"]
 
+# Matches the first character that terminates the pure API path
+# (query string or JSON body)
+_PATH_END_RE = re.compile(r"[{?]")
+
 
 def extract_api_path(uri_with_data: str) -> str:
     """
@@ -24,17 +29,8 @@ def extract_api_path(uri_with_data: str) -> str:
         >>> extract_api_path('/api/homefeed')
         '/api/homefeed'
     """
-    brace_pos = uri_with_data.find("{")
-    question_pos = uri_with_data.find("?")
-
-    if brace_pos != -1 and question_pos != -1:
-        return uri_with_data[: min(brace_pos, question_pos)]
-    elif brace_pos != -1:
-        return uri_with_data[:brace_pos]
-    elif question_pos != -1:
-        return uri_with_data[:question_pos]
-    else:
-        return uri_with_data
+    match = _PATH_END_RE.search(uri_with_data)
+    return uri_with_data[: match.start()] if match else uri_with_data
 
 
 def extract_uri(url: str) -> str:
@@ -67,6 +63,16 @@ def extract_uri(url: str) -> str:
 
     url = url.strip()
 
+    # Fast path: input is already a URI path, so drop a trailing query
+    # string directly without paying for urlparse. Protocol-relative
+    # URLs ("//host/path") are excluded: their netloc must be stripped
+    if url.startswith("/") and not url.startswith("//") and "#" not in url:
+        question_pos = url.find("?")
+        path = url[:question_pos] if question_pos != -1 else url
+        if not path or path == "/":
+            raise ValueError(f"Cannot extract valid URI path from URL: {url}")
+        return path
+
     parsed = urlparse(url)
 
     path = parsed.path
@@ -119,7 +125,7 @@ def build_url(base_url: str, params: dict | None = None) -> str:
     query_parts = []
     for key, value in params.items():
         if isinstance(value, list | tuple):
-            formatted_value = ",".join(str(v) for v in value)
+            formatted_value = ",".join(map(str, value))
         elif value is not None:
             formatted_value = str(value)
         else:
@@ -127,8 +133,9 @@ def build_url(base_url: str, params: dict | None = None) -> str:
 
         # XHS platform requires only '=' to be encoded as '%3D'
         # Other special characters must remain unencoded for signature matching
-        encoded_value = formatted_value.replace("=", "%3D")
-        query_parts.append(f"{key}={encoded_value}")
+        if "=" in formatted_value:
+            formatted_value = formatted_value.replace("=", "%3D")
+        query_parts.append(key + "=" + formatted_value)
 
     query_string = "&".join(query_parts)
 
@@ -1,7 +1,10 @@
+import random
+
 import pytest
 
-from xhshow import CryptoProcessor, Xhshow
+from xhshow import CryptoConfig, CryptoProcessor, Xhshow
 from xhshow.core.crc32_encrypt import CRC32
+from xhshow.utils._hash_numba import custom_hash_v2_nb
 
 
 class TestCryptoProcessor:
@@ -17,10 +20,29 @@ class TestCryptoProcessor:
 
         result = self.crypto.build_payload_array(hex_param, a1_value)
 
-        assert isinstance(result, list)
-        assert len(result) > 50
+        assert isinstance(result, bytes)
+        assert len(result) == self.crypto.config.PAYLOAD_LENGTH
         assert all(isinstance(x, int) and 0 <= x <= 255 for x in result)
 
+    @pytest.mark.skipif(custom_hash_v2_nb is None, reason="numba not installed")
+    def test_custom_hash_v2_implementations_agree(self, monkeypatch):
+        """测试numba内核与纯Python回退的哈希结果逐字节一致"""
+        rng = random.Random(42)
+        inputs = [bytes(rng.randrange(256) for _ in range(8 * rng.randint(1, 16))) for _ in range(100)]
+
+        compiled = [self.crypto._custom_hash_v2(data) for data in inputs]
+
+        # Force the pure-Python fallback (numpy unpack path if installed)
+        monkeypatch.setattr("xhshow.core.crypto.custom_hash_v2_nb", None)
+        numpy_fallback = [self.crypto._custom_hash_v2(data) for data in inputs]
+
+        # Force the struct.iter_unpack path as well
+        monkeypatch.setattr("xhshow.core.crypto._np", None)
+        struct_fallback = [self.crypto._custom_hash_v2(data) for data in inputs]
+
+        assert compiled == numpy_fallback == struct_fallback
+        assert all(isinstance(h, bytes) and len(h) == 16 for h in compiled)
+
     def test_bit_ops_normalize_to_32bit(self):
         """测试32位标准化"""
         result = self.crypto.bit_ops.normalize_to_32bit(0x1FFFFFFFF)
@@ -302,6 +324,23 @@ class TestIntegration:
         assert signature2.startswith("XYS_")
         assert len(signature2) == len(signature)
 
+    def test_custom_config_with_overrides(self):
+        """测试README中的自定义配置示例（覆盖前缀与签名模板）"""
+        custom_config = CryptoConfig().with_overrides(
+            X3_PREFIX="custom_",
+            SIGNATURE_DATA_TEMPLATE={"x0": "4.2.6", "x1": "xhs-pc-web", "x2": "Windows", "x3": "", "x4": ""},
+            SEQUENCE_VALUE_MIN=20,
+            SEQUENCE_VALUE_MAX=60,
+        )
+        assert custom_config.X3_PREFIX == "custom_"
+        assert custom_config.SEQUENCE_VALUE_MIN == 20
+
+        client = Xhshow(config=custom_config)
+        signature = client.sign_xs_get("/api/sns/web/v1/user_posted", "test_a1_value", params={"num": "30"})
+
+        decoded = client.decode_xs(signature)
+        assert decoded["x3"].startswith("custom_")
+
     def test_sign_xs_parameter_validation(self):
         """测试sign_xs参数验证"""
         client = Xhshow()
@@ -115,6 +115,10 @@ class TestExtractUri:
         uri = "/api/sns/web/v1/user_posted"
         assert extract_uri(uri) == "/api/sns/web/v1/user_posted"
 
+    def test_extract_uri_from_protocol_relative_url(self):
+        url = "//edith.xiaohongshu.com/api/sns/web/v2/comment/sub/page?num=10"
+        assert extract_uri(url) == "/api/sns/web/v2/comment/sub/page"
+
     def test_extract_uri_with_fragment(self):
         url = "https://example.com/path#section"
         assert extract_uri(url) == "/path"